@@ -24,6 +24,12 @@ class Config:
     MAX_FRAMES_PER_VIDEO = 20
     IMAGE_SIZE = (224, 224)
     
+    # Multi-face settings
+    MAX_FACES_PER_FRAME = 8
+    INFERENCE_BATCH_SIZE = 32  # Faces per batched forward pass
+    FACE_TRACK_IOU_THRESHOLD = 0.3  # Min box overlap to continue a face track
+    MIN_TRACK_LENGTH = 2  # Min detections for a video track to drive the file label
+    
     # Explainability
     TOP_K_FAKE_FRAMES = 3
     
@@ -8,18 +8,23 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional, List
 from services.face_detector import FaceDetector
+from services.face_tracker import FaceTracker
 from services.frame_extractor import FrameExtractor
 from services.inference_engine import InferenceEngine
 from services.explainability import GradCAM
 from utils.preprocess import Preprocessor
-from utils.postprocess import aggregate_predictions
+from utils.postprocess import aggregate_predictions, aggregate_face_tracks
 from config import Config
 from routes.upload import in_memory_store
 
 
 
 # Initialize services
-face_detector = FaceDetector()
+face_detector = FaceDetector(
+    threshold=Config.FACE_DETECTION_THRESHOLD,
+    max_faces=Config.MAX_FACES_PER_FRAME
+)
+face_tracker = FaceTracker(iou_threshold=Config.FACE_TRACK_IOU_THRESHOLD)
 frame_extractor = FrameExtractor()
 preprocessor = Preprocessor()
 inference_engine = InferenceEngine(model_path=Config.MODEL_PATH_CNN)
@@ -30,6 +35,7 @@ inference_bp = APIRouter()
 class PredictRequest(BaseModel):
     filename: str
     type: str = "image"
+    multi_face: bool = False
 
 @inference_bp.post("/predict")
 async def predict(request: PredictRequest):
@@ -72,30 +78,81 @@ async def predict(request: PredictRequest):
             
         face_tensors = []
         cropped_faces = []
+        face_boxes = []
         
         for i, frame in enumerate(frames):
-            face, box = face_detector.detect_and_crop(frame)
-            if face is not None:
+            if request.multi_face:
+                detections = face_detector.detect_and_crop_all(frame)
+            else:
+                face, box = face_detector.detect_and_crop(frame)
+                detections = [(face, box, None)] if face is not None else []
+                
+            for face, box, _ in detections:
                 cropped_faces.append((face, i))
+                face_boxes.append(box)
                 tensor = preprocessor.preprocess(face)
                 face_tensors.append(tensor)
                 
         if not face_tensors:
             raise HTTPException(status_code=400, detail="No faces detected in input")
             
+        # All faces from all frames go through batched forward passes together
         probs = inference_engine.predict_video(face_tensors)
         
-        for i, prob in enumerate(probs):
-            results["frame_predictions"].append({
-                "id": i + 1,
-                "prob": prob
-            })
+        if request.multi_face:
+            track_ids = face_tracker.assign_tracks(
+                [(frame_id, box) for (_, frame_id), box in zip(cropped_faces, face_boxes)]
+            )
+            
+            # Frame-level score is the most suspicious face in that frame
+            frame_probs = {}
+            track_indices = {}
+            for idx, (prob, track_id) in enumerate(zip(probs, track_ids)):
+                frame_id = cropped_faces[idx][1]
+                frame_probs[frame_id] = max(prob, frame_probs.get(frame_id, 0.0))
+                track_indices.setdefault(track_id, []).append(idx)
+                
+            # Both frame-level and per-face ids use the real sampled frame index
+            for frame_id in sorted(frame_probs):
+                results["frame_predictions"].append({
+                    "id": frame_id + 1,
+                    "prob": frame_probs[frame_id]
+                })
+                
+            # A still image has one detection per face, so track length only applies to video
+            final_prob, label, confidence, track_results = aggregate_face_tracks(
+                {track_id: [probs[idx] for idx in indices] for track_id, indices in track_indices.items()},
+                min_track_length=Config.MIN_TRACK_LENGTH if input_type == 'video' else 1
+            )
+            
+            results["faces"] = []
+            for track_id, indices in track_indices.items():
+                track_prob, track_label, track_confidence = track_results[track_id]
+                results["faces"].append({
+                    "track_id": track_id + 1,
+                    "prob": track_prob,
+                    "final_prediction": track_label,
+                    "confidence": track_confidence,
+                    "frame_predictions": [{
+                        "id": cropped_faces[idx][1] + 1,
+                        "prob": probs[idx],
+                        "box": face_boxes[idx].tolist()
+                    } for idx in indices]
+                })
+        else:
+            for i, prob in enumerate(probs):
+                results["frame_predictions"].append({
+                    "id": i + 1,
+                    "prob": prob
+                })
+                
+            final_prob, label, confidence = aggregate_predictions(probs)
             
-        final_prob, label, confidence = aggregate_predictions(probs)
         results["final_prediction"] = label
         results["confidence"] = confidence
         
         heatmaps = []
+        heatmap_sources = []
         full_heatmap_images = []
         sorted_indices = sorted(range(len(probs)), key=lambda k: probs[k], reverse=True)
         top_k = Config.TOP_K_FAKE_FRAMES
@@ -116,7 +173,16 @@ async def predict(request: PredictRequest):
                 heatmaps.append(f"data:image/jpeg;base64,{base64_str}")
                 full_heatmap_images.append(overlay)
                 
+                if request.multi_face:
+                    heatmap_sources.append({
+                        "track_id": track_ids[idx] + 1,
+                        "frame_id": frame_id + 1
+                    })
+                
         results["heatmaps"] = heatmaps
+        if request.multi_face:
+            # Aligned with 'heatmaps' so each overlay can be matched to an entry in 'faces'
+            results["heatmap_sources"] = heatmap_sources
         results["full_heatmaps"] = full_heatmap_images
         
         # Create a clean response object without non-serializable data
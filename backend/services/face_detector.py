@@ -8,7 +8,7 @@ from facenet_pytorch import MTCNN
 import torch
 
 class FaceDetector:
-    def __init__(self, threshold=0.90):
+    def __init__(self, threshold=0.90, max_faces=8):
         # Force CPU as per TRD
         self.device = torch.device('cpu')
         self.detector = MTCNN(
@@ -19,6 +19,19 @@ class FaceDetector:
             selection_method='probability'
         )
         self.conf_threshold = threshold
+        self.max_faces = max_faces
+
+    def _to_rgb(self, image):
+        # Convert BGR to RGB if necessary
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB) if image.shape[2] == 3 else image
+
+    def _crop(self, image_rgb, box):
+        box = box.astype(int)
+        # Ensure box within image boundaries
+        x1, y1, x2, y2 = box
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(image_rgb.shape[1], x2), min(image_rgb.shape[0], y2)
+        return image_rgb[y1:y2, x1:x2], np.array([x1, y1, x2, y2])
 
     def detect_and_crop(self, image):
         """
@@ -29,8 +42,7 @@ class FaceDetector:
         if image is None:
             return None
             
-        # Convert BGR to RGB if necessary
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB) if image.shape[2] == 3 else image
+        image_rgb = self._to_rgb(image)
         
         # Detect faces
         boxes, probs = self.detector.detect(image_rgb)
@@ -39,13 +51,34 @@ class FaceDetector:
             # Get the best face
             best_idx = np.argmax(probs)
             if probs[best_idx] >= self.conf_threshold:
-                box = boxes[best_idx].astype(int)
-                # Ensure box within image boundaries
-                x1, y1, x2, y2 = box
-                x1, y1 = max(0, x1), max(0, y1)
-                x2, y2 = min(image_rgb.shape[1], x2), min(image_rgb.shape[0], y2)
-                
-                cropped_face = image_rgb[y1:y2, x1:x2]
-                return cropped_face, box
+                return self._crop(image_rgb, boxes[best_idx])
                 
         return None, None
+
+    def detect_and_crop_all(self, image):
+        """
+        Detects every face above the confidence threshold in a single detector call.
+        :param image: numpy array (BGR or RGB)
+        :return: List of (cropped_face, box, det_prob), most confident first
+        """
+        if image is None:
+            return []
+            
+        image_rgb = self._to_rgb(image)
+        # detect() returns every candidate box regardless of keep_all
+        boxes, probs = self.detector.detect(image_rgb)
+        
+        if boxes is None or len(boxes) == 0:
+            return []
+            
+        faces = []
+        for idx in np.argsort(probs)[::-1][:self.max_faces]:
+            if probs[idx] < self.conf_threshold:
+                break
+            face, box = self._crop(image_rgb, boxes[idx])
+            # Skip degenerate boxes that fall entirely outside the frame
+            if face.size == 0:
+                continue
+            faces.append((face, box, float(probs[idx])))
+            
+        return faces
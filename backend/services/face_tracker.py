@@ -0,0 +1,62 @@
+"""
+Face Tracker Service.
+Responsibility: Link face detections across frames into per-face tracks.
+"""
+import numpy as np
+
+def box_iou(box_a, box_b):
+    """
+    Intersection-over-union of two [x1, y1, x2, y2] boxes.
+    """
+    x1, y1 = max(box_a[0], box_b[0]), max(box_a[1], box_b[1])
+    x2, y2 = min(box_a[2], box_b[2]), min(box_a[3], box_b[3])
+    inter = max(0, x2 - x1) * max(0, y2 - y1)
+    area_a = max(0, box_a[2] - box_a[0]) * max(0, box_a[3] - box_a[1])
+    area_b = max(0, box_b[2] - box_b[0]) * max(0, box_b[3] - box_b[1])
+    union = area_a + area_b - inter
+    return float(inter / union) if union > 0 else 0.0
+
+class FaceTracker:
+    def __init__(self, iou_threshold=0.3):
+        self.iou_threshold = iou_threshold
+
+    def assign_tracks(self, detections):
+        """
+        Greedily matches each frame's faces to the track whose last box overlaps most.
+        :param detections: List of (frame_idx, box) in frame order.
+        :return: List of track ids, aligned with detections.
+        """
+        track_ids = [None] * len(detections)
+        last_boxes = {}  # track_id -> last box seen
+        next_track_id = 0
+
+        # Group detection indices by frame so a track gets at most one face per frame
+        frames = {}
+        for det_idx, (frame_idx, _) in enumerate(detections):
+            frames.setdefault(frame_idx, []).append(det_idx)
+
+        for frame_idx in sorted(frames):
+            det_indices = frames[frame_idx]
+            candidates = []
+            for det_idx in det_indices:
+                box = detections[det_idx][1]
+                for track_id, last_box in last_boxes.items():
+                    iou = box_iou(box, last_box)
+                    if iou >= self.iou_threshold:
+                        candidates.append((iou, det_idx, track_id))
+
+            # Highest-overlap pairs claim their track first
+            claimed_tracks = set()
+            for iou, det_idx, track_id in sorted(candidates, key=lambda c: c[0], reverse=True):
+                if track_ids[det_idx] is not None or track_id in claimed_tracks:
+                    continue
+                track_ids[det_idx] = track_id
+                claimed_tracks.add(track_id)
+
+            for det_idx in det_indices:
+                if track_ids[det_idx] is None:
+                    track_ids[det_idx] = next_track_id
+                    next_track_id += 1
+                last_boxes[track_ids[det_idx]] = np.asarray(detections[det_idx][1])
+
+        return track_ids
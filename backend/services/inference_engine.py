@@ -57,13 +57,25 @@ class InferenceEngine:
             fake_prob = probs[0][1].item()
         return fake_prob
 
+    def predict_batch(self, face_tensors, batch_size=Config.INFERENCE_BATCH_SIZE):
+        """
+        Runs batched inference on many face tensors.
+        :param face_tensors: List of normalized tensors [1, 3, 224, 224].
+        :param batch_size: Max faces per forward pass.
+        :return: List of probabilities, in input order.
+        """
+        probs = []
+        with torch.no_grad():
+            for start in range(0, len(face_tensors), batch_size):
+                batch = torch.cat(face_tensors[start:start + batch_size], dim=0).to(self.device)
+                output = self.model(batch)
+                probs.extend(torch.softmax(output, dim=1)[:, 1].tolist())
+        return probs
+
     def predict_video(self, face_tensors):
         """
         Runs inference on multiple face tensors (video frames).
         :param face_tensors: List of normalized tensors.
         :return: List of probabilities.
         """
-        probs = []
-        for tensor in face_tensors:
-            probs.append(self.predict(tensor))
-        return probs
+        return self.predict_batch(face_tensors)
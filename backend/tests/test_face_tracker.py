@@ -0,0 +1,52 @@
+import pytest
+from services.face_tracker import FaceTracker, box_iou
+
+def test_box_iou():
+    assert box_iou([0, 0, 10, 10], [0, 0, 10, 10]) == 1.0
+    assert box_iou([0, 0, 10, 10], [20, 20, 30, 30]) == 0.0
+    assert box_iou([0, 0, 10, 10], [0, 0, 10, 5]) == pytest.approx(0.5)
+    assert box_iou([0, 0, 0, 0], [0, 0, 0, 0]) == 0.0
+
+def test_iou_exactly_at_threshold_continues_track():
+    tracker = FaceTracker(iou_threshold=0.5)
+    detections = [(0, [0, 0, 10, 10]), (1, [0, 0, 10, 5])]
+    assert tracker.assign_tracks(detections) == [0, 0]
+
+def test_iou_below_threshold_starts_new_track():
+    tracker = FaceTracker(iou_threshold=0.51)
+    detections = [(0, [0, 0, 10, 10]), (1, [0, 0, 10, 5])]
+    assert tracker.assign_tracks(detections) == [0, 1]
+
+def test_separate_faces_keep_their_tracks():
+    tracker = FaceTracker()
+    detections = [
+        (0, [0, 0, 10, 10]),
+        (0, [50, 50, 60, 60]),
+        (1, [51, 51, 61, 61]),
+        (1, [1, 0, 11, 10]),
+    ]
+    assert tracker.assign_tracks(detections) == [0, 1, 1, 0]
+
+def test_one_face_per_track_per_frame():
+    tracker = FaceTracker(iou_threshold=0.1)
+    # Both faces in frame 1 overlap the single track from frame 0
+    detections = [(0, [0, 0, 10, 10]), (1, [2, 0, 12, 10]), (1, [0, 0, 10, 10])]
+    assert tracker.assign_tracks(detections) == [0, 1, 0]
+
+def test_track_survives_skipped_frame():
+    tracker = FaceTracker()
+    detections = [(0, [0, 0, 10, 10]), (2, [1, 1, 11, 11])]
+    assert tracker.assign_tracks(detections) == [0, 0]
+
+def test_crossing_faces_keep_identity():
+    # Low threshold so each face also matches the other track; highest overlap must win
+    tracker = FaceTracker(iou_threshold=0.05)
+    detections = [
+        (0, [0, 0, 10, 10]), (0, [20, 0, 30, 10]),
+        (1, [4, 0, 14, 10]), (1, [16, 0, 26, 10]),
+        (2, [12, 0, 22, 10]), (2, [8, 0, 18, 10]),
+    ]
+    assert tracker.assign_tracks(detections) == [0, 1, 0, 1, 1, 0]
+
+def test_no_detections():
+    assert FaceTracker().assign_tracks([]) == []
@@ -0,0 +1,33 @@
+import pytest
+from utils.postprocess import aggregate_face_tracks
+
+def test_file_score_is_most_suspicious_track():
+    final_prob, label, confidence, track_results = aggregate_face_tracks({0: [0.1, 0.2], 1: [0.9, 0.7]})
+    assert final_prob == pytest.approx(0.9)
+    assert label == "FAKE"
+    assert confidence == pytest.approx(90.0)
+    assert track_results[0][1] == "REAL"
+    assert track_results[1][1] == "FAKE"
+
+def test_input_probs_are_not_mutated():
+    probs = [0.1, 0.9, 0.5]
+    aggregate_face_tracks({0: probs})
+    assert probs == [0.1, 0.9, 0.5]
+
+def test_short_tracks_do_not_drive_label():
+    # A one-frame false positive must not flip a consistently real video
+    final_prob, label, _, track_results = aggregate_face_tracks(
+        {0: [0.1, 0.2, 0.1], 1: [0.95]}, min_track_length=2
+    )
+    assert label == "REAL"
+    assert final_prob == pytest.approx(0.2)
+    # The short track is still scored and reported
+    assert track_results[1][1] == "FAKE"
+
+def test_falls_back_to_all_tracks_when_none_long_enough():
+    final_prob, label, _, _ = aggregate_face_tracks({0: [0.2], 1: [0.8]}, min_track_length=2)
+    assert final_prob == pytest.approx(0.8)
+    assert label == "FAKE"
+
+def test_no_tracks():
+    assert aggregate_face_tracks({}) == (0.0, "UNKNOWN", 0.0, {})
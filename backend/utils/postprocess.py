@@ -28,3 +28,31 @@ def aggregate_predictions(probs):
     confidence = final_prob if label == "FAKE" else (1 - final_prob)
     
     return final_prob, label, confidence * 100
+
+def aggregate_face_tracks(track_probs, min_track_length=1):
+    """
+    Aggregates per-face track probabilities into a per-file prediction.
+    A file is only as real as its most suspicious face, so the file score is the max track score.
+    Tracks shorter than min_track_length (e.g. one-frame false positives) are still scored,
+    but only drive the file label when no track is long enough.
+    :param track_probs: Dict of track_id -> list of floats (probabilities)
+    :param min_track_length: Min detections for a track to count towards the file score
+    :return: (final_prob, label, confidence, track_results)
+    """
+    track_results = {}
+    for track_id, probs in track_probs.items():
+        # Copy since aggregate_predictions sorts in place
+        track_results[track_id] = aggregate_predictions(list(probs))
+        
+    if not track_results:
+        return 0.0, "UNKNOWN", 0.0, track_results
+        
+    eligible = [track_id for track_id, probs in track_probs.items() if len(probs) >= min_track_length]
+    if not eligible:
+        eligible = list(track_results)
+        
+    final_prob = max(track_results[track_id][0] for track_id in eligible)
+    label = "FAKE" if final_prob >= 0.5 else "REAL"
+    confidence = final_prob if label == "FAKE" else (1 - final_prob)
+    
+    return final_prob, label, confidence * 100, track_results